@@ -2305,13 +2305,52 @@ out:
 }
 
 
+/*
+ * Inserts the specified Python value into the specified column of the
+ * current row. If encoded is true, the value must be a bytes object
+ * holding the comma separated string representation of the elements.
+ * The column index must refer to a column other than the ID column.
+ * Returns 0 on success; otherwise -1 is returned with the appropriate
+ * Python exception set.
+ */
+static int
+Table_insert_value(Table *self, int col_index, PyObject *value, int encoded)
+{
+    int ret = -1;
+    Column *col = self->columns[col_index];
+    char *v;
+    int m, wt_ret;
+    if (encoded) {
+        if (!PyBytes_Check(value)) {
+            PyErr_Format(PyExc_TypeError, "Encoded values must be bytes.");
+            goto out;
+        }
+        v = PyBytes_AS_STRING(value);
+        wt_ret = col->string_to_native(col, v);
+    } else {
+        wt_ret = col->python_to_native(col, value);
+    }
+    if (wt_ret < 0) {
+        goto out;
+    }
+    if (wt_ret != WT_MISSING_VALUE) {
+        m = Column_update_row(col, self->row_buffer, self->current_row_size);
+        if (m < 0) {
+            goto out;
+        }
+        self->current_row_size += m;
+    }
+    ret = 0;
+out:
+    return ret;
+}
+
 static PyObject *
 Table_insert_elements(Table* self, PyObject *args)
 {
     PyObject *ret = NULL;
-    Column *col = NULL;
     PyObject *elements = NULL;
-    int m, col_index, wt_ret;
+    int col_index;
     if (!PyArg_ParseTuple(args, "iO", &col_index, &elements)) {
         goto out;
     }
@@ -2325,18 +2364,9 @@ Table_insert_elements(Table* self, PyObject *args)
     if (Table_check_write_mode(self) != 0) {
         goto out;
     }
-    col = self->columns[col_index];
-    wt_ret = col->python_to_native(col, elements);
-    if (wt_ret < 0) {
+    if (Table_insert_value(self, col_index, elements, 0) != 0) {
         goto out;
     }
-    if (wt_ret != WT_MISSING_VALUE) {
-        m = Column_update_row(col, self->row_buffer, self->current_row_size);
-        if (m < 0) {
-            goto out;
-        }
-        self->current_row_size += m;
-    }
     Py_INCREF(Py_None);
     ret = Py_None;
 out:
@@ -2347,10 +2377,8 @@ static PyObject *
 Table_insert_encoded_elements(Table* self, PyObject *args)
 {
     PyObject *ret = NULL;
-    Column *column = NULL;
     PyBytesObject *value = NULL;
-    char *v;
-    int  m, col_index;
+    int col_index;
     if (!PyArg_ParseTuple(args, "iO!", &col_index, &PyBytes_Type,
             &value)) {
         goto out;
@@ -2365,16 +2393,9 @@ Table_insert_encoded_elements(Table* self, PyObject *args)
     if (Table_check_write_mode(self) != 0) {
         goto out;
     }
-    column = self->columns[col_index];
-    v = PyBytes_AsString((PyObject *) value);
-    if (column->string_to_native(column, v) < 0) {
+    if (Table_insert_value(self, col_index, (PyObject *) value, 1) != 0) {
         goto out;
     }
-    m = Column_update_row(column, self->row_buffer, self->current_row_size);
-    if (m < 0) {
-        goto out;
-    }
-    self->current_row_size += m;
     Py_INCREF(Py_None);
     ret = Py_None;
 out:
@@ -2526,6 +2547,81 @@ out:
     return ret;
 }
 
+/*
+ * Inserts the values in the specified sequence into the current row and
+ * commits it. The ith value in the sequence is inserted into the ith column;
+ * values that are None are skipped. This is equivalent to calling
+ * insert_elements (or insert_encoded_elements) for each value followed
+ * by commit_row, but avoids the overhead of a Python call per column.
+ */
+static PyObject *
+Table_append_sequence(Table *self, PyObject *row, int encoded)
+{
+    PyObject *ret = NULL;
+    PyObject *seq = NULL;
+    PyObject **items;
+    Py_ssize_t j, n;
+    if (Table_check_write_mode(self) != 0) {
+        goto out;
+    }
+    seq = PySequence_Fast(row, "Row must be a sequence");
+    if (seq == NULL) {
+        goto out;
+    }
+    n = PySequence_Fast_GET_SIZE(seq);
+    items = PySequence_Fast_ITEMS(seq);
+    for (j = 0; j < n; j++) {
+        if (items[j] != Py_None) {
+            if (Table_check_column_index(self, (int) j) != 0) {
+                goto out;
+            }
+            if (j == 0) {
+                PyErr_Format(WormtableError, "Cannot update ID column.");
+                goto out;
+            }
+            if (Table_insert_value(self, (int) j, items[j], encoded) != 0) {
+                goto out;
+            }
+        }
+    }
+    ret = Table_commit_row(self);
+out:
+    if (ret == NULL && seq != NULL) {
+        /* discard any values inserted before the error so that a failed
+         * append leaves nothing behind in the next committed row */
+        memset(self->row_buffer, 0, self->current_row_size);
+        self->current_row_size = self->fixed_region_size;
+    }
+    Py_XDECREF(seq);
+    return ret;
+}
+
+static PyObject *
+Table_append_row(Table* self, PyObject *args)
+{
+    PyObject *ret = NULL;
+    PyObject *row = NULL;
+    if (!PyArg_ParseTuple(args, "O", &row)) {
+        goto out;
+    }
+    ret = Table_append_sequence(self, row, 0);
+out:
+    return ret;
+}
+
+static PyObject *
+Table_append_encoded_row(Table* self, PyObject *args)
+{
+    PyObject *ret = NULL;
+    PyObject *row = NULL;
+    if (!PyArg_ParseTuple(args, "O", &row)) {
+        goto out;
+    }
+    ret = Table_append_sequence(self, row, 1);
+out:
+    return ret;
+}
+
 static PyObject *
 Table_get_num_rows(Table* self)
 {
@@ -2584,25 +2680,19 @@ out:
     return ret;
 }
 
+/*
+ * Returns a tuple containing the values of all columns in the row currently
+ * held in the row buffer, or NULL with the appropriate Python exception set.
+ */
 static PyObject *
-Table_get_row(Table* self, PyObject *args)
+Table_get_python_row(Table *self)
 {
     PyObject *ret = NULL;
     PyObject *t = NULL;
     Column *col = NULL;
     PyObject *value = NULL;
     int wt_ret;
-    unsigned long long row_id = 0;
     uint32_t j;
-    if (!PyArg_ParseTuple(args, "K", &row_id)) {
-        goto out;
-    }
-    if (Table_check_read_mode(self) != 0) {
-        goto out;
-    }
-    if (Table_retrieve_row_by_id(self, (uint64_t) row_id) != 0) {
-        goto out;
-    }
     t = PyTuple_New(self->num_columns);
     if (t == NULL) {
         PyErr_NoMemory();
@@ -2627,6 +2717,130 @@ out:
     return ret;
 }
 
+static PyObject *
+Table_get_row(Table* self, PyObject *args)
+{
+    PyObject *ret = NULL;
+    unsigned long long row_id = 0;
+    if (!PyArg_ParseTuple(args, "K", &row_id)) {
+        goto out;
+    }
+    if (Table_check_read_mode(self) != 0) {
+        goto out;
+    }
+    if (Table_retrieve_row_by_id(self, (uint64_t) row_id) != 0) {
+        goto out;
+    }
+    ret = Table_get_python_row(self);
+out:
+    return ret;
+}
+
+/*
+ * Returns a list of the rows with start <= row_id < stop. The rows are
+ * read sequentially using a single cursor, rather than by looking up
+ * each row_id individually.
+ */
+static PyObject *
+Table_get_rows(Table* self, PyObject *args)
+{
+    PyObject *ret = NULL;
+    PyObject *list = NULL;
+    PyObject *t = NULL;
+    Column *id_col = NULL;
+    unsigned long long start = 0;
+    unsigned long long stop = 0;
+    unsigned char min_key[sizeof(uint64_t)];
+    unsigned char max_key[sizeof(uint64_t)];
+    uint32_t key_size;
+    uint32_t flags;
+    uint64_t max_row_id;
+    int has_max;
+    int db_ret;
+    DBC *cursor = NULL;
+    DBT key, data;
+    if (!PyArg_ParseTuple(args, "KK", &start, &stop)) {
+        goto out;
+    }
+    if (Table_check_read_mode(self) != 0) {
+        goto out;
+    }
+    list = PyList_New(0);
+    if (list == NULL) {
+        goto out;
+    }
+    id_col = self->columns[0];
+    key_size = id_col->element_size;
+    max_row_id = max_uint(key_size);
+    if (start >= stop || start > max_row_id) {
+        ret = list;
+        list = NULL;
+        goto out;
+    }
+    /* If stop cannot be encoded as a row id, no row can reach it and we
+     * iterate to the end of the table. */
+    has_max = stop <= max_row_id;
+    /* this is safe because the id column must be at offset 0 */
+    if (Column_set_row_id(id_col, (uint64_t) start) != 0) {
+        goto out;
+    }
+    if (Column_update_row(id_col, min_key, 0) != 0) {
+        goto out;
+    }
+    if (has_max) {
+        if (Column_set_row_id(id_col, (uint64_t) stop) != 0) {
+            goto out;
+        }
+        if (Column_update_row(id_col, max_key, 0) != 0) {
+            goto out;
+        }
+    }
+    db_ret = self->db->cursor(self->db, NULL, &cursor, 0);
+    if (db_ret != 0) {
+        handle_bdb_error(db_ret);
+        goto out;
+    }
+    memset(&key, 0, sizeof(DBT));
+    memset(&data, 0, sizeof(DBT));
+    key.data = min_key;
+    key.size = key_size;
+    flags = DB_SET_RANGE;
+    while ((db_ret = cursor->get(cursor, &key, &data, flags)) == 0) {
+        flags = DB_NEXT;
+        if (key.size != key_size) {
+            PyErr_Format(PyExc_SystemError, "key size mismatch.");
+            goto out;
+        }
+        if (has_max && memcmp(max_key, key.data, key_size) <= 0) {
+            break;
+        }
+        if (Table_retrieve_row(self, &key, &data) != 0) {
+            goto out;
+        }
+        t = Table_get_python_row(self);
+        if (t == NULL) {
+            goto out;
+        }
+        if (PyList_Append(list, t) != 0) {
+            Py_DECREF(t);
+            goto out;
+        }
+        Py_DECREF(t);
+    }
+    if (db_ret != 0 && db_ret != DB_NOTFOUND) {
+        handle_bdb_error(db_ret);
+        goto out;
+    }
+    ret = list;
+    list = NULL;
+out:
+    if (cursor != NULL) {
+        cursor->close(cursor);
+    }
+    Py_XDECREF(list);
+    return ret;
+}
+
 
 
 
@@ -2635,10 +2849,17 @@ static PyMethodDef Table_methods[] = {
             "Returns the number of rows in the table" },
     {"get_row", (PyCFunction) Table_get_row, METH_VARARGS,
             "Return the jth row as a tuple" },
+    {"get_rows", (PyCFunction) Table_get_rows, METH_VARARGS,
+            "Return the rows with start <= row_id < stop as a list of tuples" },
     {"open", (PyCFunction) Table_open, METH_VARARGS, "Open the table" },
     {"close", (PyCFunction) Table_close, METH_NOARGS, "Close the table" },
     {"commit_row", (PyCFunction) Table_commit_row, METH_NOARGS,
             "Commit a row to the table in write mode." },
+    {"append_row", (PyCFunction) Table_append_row, METH_VARARGS,
+            "Insert the native Python values in a sequence and commit the row." },
+    {"append_encoded_row", (PyCFunction) Table_append_encoded_row,
+            METH_VARARGS,
+            "Insert the encoded values in a sequence and commit the row." },
     {"insert_elements", (PyCFunction) Table_insert_elements, METH_VARARGS,
             "insert element values encoded as native Python objects." },
     {"insert_encoded_elements", (PyCFunction) Table_insert_encoded_elements,
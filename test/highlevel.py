@@ -233,6 +233,38 @@ class TableBuildTest(WormtableTest):
         self.assertTrue(t[0] == (0, 1))
         t.close()
 
+    def test_rebuild(self):
+        """
+        Tests that the metadata is re-read when a table is rebuilt.
+        """
+        for n in range(1, 4):
+            t = wt.Table(self._homedir)
+            t.add_id_column()
+            for j in range(n):
+                t.add_uint_column("u" + str(j))
+            t.open("w")
+            t.append([None] + list(range(n)))
+            t.close()
+            t.open("r")
+            self.assertEqual(len(t.columns()), n + 1)
+            self.assertEqual(t[0], (0,) + tuple(range(n)))
+            t.close()
+
+    def test_get_column_before_open(self):
+        """
+        Tests that columns can be looked up by name as soon as they
+        are added.
+        """
+        t = wt.Table(self._homedir)
+        t.add_id_column()
+        names = ["u" + str(j) for j in range(5)]
+        for name in names:
+            t.add_uint_column(name)
+        for j, name in enumerate(names):
+            col = t.get_column(name)
+            self.assertEqual(col.get_name(), name)
+            self.assertIs(col, t.get_column(j + 1))
+
     def test_missing_values(self):
         """
         Tests if missing values are correctly inserted.
@@ -1066,6 +1098,12 @@ class TableCursorTest(WormtableTest):
             pass
         self.assertRaises(StopIteration, next, cursor)
 
+    def test_prefetch(self):
+        t = self._table
+        rows = t[:]
+        t.prefetch()
+        self.assertEqual(rows, [r for r in t.cursor(t.columns())])
+
 
 class FloatTest(WormtableTest):
     """
@@ -625,6 +625,25 @@ class TestDatabaseIntegerIntegrity(TestDatabaseInteger):
                 j += 1
             self.assertEqual(j, n)
 
+    def test_get_rows_ranges(self):
+        self.populate_randomly()
+        self.open_reading()
+        n = self.num_rows
+        self.assertEqual(self._database.get_rows(0, n), self.rows)
+        self.assertEqual(self._database.get_rows(0, n + 1), self.rows)
+        max_id = self._columns[0].max_element
+        for stop in [max_id, max_id + 1, max_id + 2, 2**64 - 1]:
+            self.assertEqual(self._database.get_rows(0, stop), self.rows)
+        self.assertEqual([], self._database.get_rows(max_id + 1, 2**64 - 1))
+        for j in range(10):
+            l = [random.randint(0, n - 1), random.randint(0, n - 1)]
+            bottom = min(l)
+            top = max(l)
+            self.assertEqual([], self._database.get_rows(top, bottom))
+            self.assertEqual([], self._database.get_rows(bottom, bottom))
+            rows = self._database.get_rows(bottom, top)
+            self.assertEqual(rows, self.rows[bottom:top])
+
     def test_row_iterator_columns(self):
         self.populate_randomly()
         self.open_reading()
@@ -1411,6 +1430,66 @@ class TestTableInitialisation(TestTable):
             self.assertEqual(t.get_num_rows(), n)
         t.close()
 
+    def test_get_rows_full_id_column(self):
+        """
+        Tests that we can retrieve all rows from a table whose id column
+        is full, using stop values beyond the maximum row id.
+        """
+        c0 = get_uint_column(1, 1)
+        c1 = get_uint_column(1, 1)
+        f1 = self._db_file.encode()
+        f2 = self._data_file.encode()
+        t = _wormtable.Table(f1, f2, [c0, c1], 0)
+        t.open(WT_WRITE)
+        n = c0.max_element + 1
+        for j in range(n):
+            t.insert_elements(1, j % 100)
+            t.commit_row()
+        t.close()
+        t.open(WT_READ)
+        rows = [(j, j % 100) for j in range(n)]
+        self.assertEqual(t.get_num_rows(), n)
+        for stop in [n, n + 1, 2**64 - 1]:
+            self.assertEqual(t.get_rows(0, stop), rows)
+        self.assertEqual(t.get_rows(n - 1, n + 1), rows[-1:])
+        self.assertEqual(t.get_rows(n, n + 1), [])
+        t.close()
+
+    def test_append_row(self):
+        """
+        Tests that appending whole rows is equivalent to inserting the
+        elements individually.
+        """
+        c0 = get_uint_column(1, 1)
+        c1 = get_uint_column(1, 1)
+        c2 = get_uint_column(1, 1)
+        f1 = self._db_file.encode()
+        f2 = self._data_file.encode()
+        t = _wormtable.Table(f1, f2, [c0, c1, c2], 0)
+        self.assertRaises(WormtableError, t.append_row, [None, 1, 2])
+        t.open(WT_WRITE)
+        self.assertRaises(TypeError, t.append_row, 1)
+        self.assertRaises(TypeError, t.append_encoded_row, None)
+        self.assertRaises(WormtableError, t.append_row, [0])
+        self.assertRaises(WormtableError, t.append_encoded_row, [b"0"])
+        self.assertRaises(WormtableError, t.append_row, [None, 1, 2, 3])
+        self.assertRaises(TypeError, t.append_encoded_row, [None, 1])
+        self.assertRaises(OverflowError, t.append_row, [None, 1, 2**8])
+        t.commit_row()
+        n = 10
+        for j in range(n):
+            t.append_row([None, j, None])
+            t.append_encoded_row((None, None, str(j).encode()))
+        t.close()
+        self.assertRaises(WormtableError, t.append_row, [None, 1, 2])
+        t.open(WT_READ)
+        self.assertEqual(t.get_num_rows(), 2 * n + 1)
+        self.assertEqual(t.get_row(0), (0, None, None))
+        for j in range(n):
+            self.assertEqual(t.get_row(2 * j + 1), (2 * j + 1, j, None))
+            self.assertEqual(t.get_row(2 * j + 2), (2 * j + 2, None, j))
+        t.close()
+
 class TestIndex(unittest.TestCase):
     """
     Base class for testing tables.
@@ -191,6 +191,27 @@ class BuildSampleVCFTest(VcfBuildTest, Vcf2wtTest):
         return SAMPLE_VCF
 
 
+class Vcf2wtHeaderTest(Vcf2wtTest):
+    """
+    Tests the parsing of VCF header lines.
+    """
+    def test_description(self):
+        vcf = os.path.join(self._homedir, "header.vcf")
+        description = "Depth (reads with MQ>20, see <http://x.org/a=b>)"
+        with open(vcf, "w") as f:
+            f.write("##fileformat=VCFv4.1\n")
+            f.write("##INFO=<ID=DP,Number=1,Type=Integer,Description=")
+            f.write("\"{0}\">\n".format(description))
+            f.write("#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n")
+            f.write("1\t1\t.\tA\tC\t1\t.\tDP=5\n")
+        table = os.path.join(self._homedir, "table")
+        self.run_command([vcf, table, "-q"])
+        with wt.open_table(table) as t:
+            col = t.get_column("INFO.DP")
+            self.assertEqual(col.get_description(), description)
+            self.assertEqual(t[0][col.get_position()], 5)
+
+
 class Vcf2wtTestInputMethods(Vcf2wtTest, TestInputMethods):
     """
     Test if the various input methods result in the same output file.
@@ -22,6 +22,7 @@ Command line interface utilities for wormtable.
 from __future__ import print_function
 from __future__ import division
 
+import io
 import gzip
 import os
 import sys
@@ -29,6 +30,16 @@ import time
 
 import wormtable as wt
 
+try:
+    # ISA-L's igzip is a drop-in replacement for gzip and decompresses
+    # considerably faster. Fall back to the standard library if missing.
+    from isal import igzip as gzip_module
+except ImportError:
+    gzip_module = gzip
+
+# Size of the buffer used when reading compressed input.
+GZIP_BUFFER_SIZE = 4 * 2**20
+
 
 def add_version_argument(parser):
     """
@@ -49,29 +60,49 @@ class ProgressMonitor(object):
         self.__progress_width = 40
         self.__bar_index = 0
         self.__bars = "/-\\|"
-        self.__start_time = time.process_time()
+        self.__start_time = time.perf_counter()
+        self.__last_draw_time = None
+        self.__min_draw_interval = 0.1
+        self.__processed = None
 
-    def update(self, processed):
+    def __draw(self, now):
         """
-        Updates this progress monitor to display the specified number
-        of processed items.
+        Redraws the progress bar for the most recently processed count.
         """
+        self.__last_draw_time = now
+        processed = self.__processed
         complete = processed / self.__total
         filled = int(complete * self.__progress_width)
         spaces = self.__progress_width - filled
         bar = self.__bars[self.__bar_index]
         self.__bar_index = (self.__bar_index + 1) % len(self.__bars)
-        elapsed = max(1, time.process_time() - self.__start_time)
+        elapsed = max(1e-6, now - self.__start_time)
         rate = processed / elapsed
         s = '\r[{0}{1}] {2:5.1f}% @{3:8.1E} {4}/s {5}'.format('#' * filled,
             ' ' * spaces, complete * 100, rate, self.__units, bar)
         sys.stdout.write(s)
         sys.stdout.flush()
 
+    def update(self, processed):
+        """
+        Updates this progress monitor to display the specified number
+        of processed items. The display is redrawn at most once every
+        tenth of a second, except when all items have been processed.
+        """
+        self.__processed = processed
+        now = time.perf_counter()
+        if (self.__last_draw_time is not None and processed < self.__total
+                and now - self.__last_draw_time < self.__min_draw_interval):
+            return
+        self.__draw(now)
+
     def finish(self):
         """
-        Completes the progress monitor.
+        Completes the progress monitor, drawing the final state of the
+        progress bar.
         """
+        if self.__processed is not None:
+            self.__draw(time.perf_counter())
         print()
 
 BROKEN_GZIP_MESSAGE = """
@@ -106,16 +137,19 @@ class FileReader(object):
                 # Detect broken GZIP handling in 2.7/3.2 and others and abort
                 # TODO this has been fixed upstream and can be removed at
                 # some point.
-                f = gzip.open(in_file, "rb")
+                f = gzip_module.open(in_file, "rb")
                 try:
                     s = f.readline()
                 except Exception as e:
                     print(BROKEN_GZIP_MESSAGE)
                     sys.exit(1)
                 f.close()
-                # Carry on as before
-                self.__input_file = gzip.open(in_file, "rb")
-                self.__progress_file = self.__input_file.fileobj
+                # Carry on as before. We open the underlying file ourselves
+                # so that we can track progress through it.
+                self.__progress_file = open(in_file, "rb")
+                gz = gzip_module.GzipFile(fileobj=self.__progress_file,
+                        mode="rb")
+                self.__input_file = io.BufferedReader(gz, GZIP_BUFFER_SIZE)
             else:
                 self.__input_file = open(in_file, "rb")
                 self.__progress_file = self.__input_file
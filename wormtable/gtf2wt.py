@@ -165,8 +165,9 @@ class ProgramRunner(object):
         self.__table.set_db_cache_size(self.__db_cache_size)
         self.__table.open("w")
         self.__reader.set_progress(self.__progress)
+        append = self.__table.append_encoded
         for r in self.__reader.rows():
-            self.__table.append_encoded([None] + r)
+            append([None] + r)
         self.__table.close()
 
     def run(self):
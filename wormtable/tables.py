@@ -28,10 +28,11 @@ from __future__ import print_function
 from __future__ import division
 
 import os
+import sys
 import glob
-import shutil
+import operator
+import functools
 import collections
-from xml.dom import minidom
 from xml.etree import ElementTree
 
 import _wormtable
@@ -80,6 +81,54 @@ def open_table(homedir, db_cache_size=DEFAULT_CACHE_SIZE_STR):
     return t
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_xml_file(path, inode, mtime, size):
+    """
+    Returns the ElementTree for the XML file at the specified path. The
+    remaining arguments identify the version of the file and are used
+    only as part of the cache key.
+    """
+    return ElementTree.parse(path)
+
+
+def _parse_xml(filename):
+    """
+    Returns the ElementTree for the specified XML file. Parsed trees are
+    cached, so repeatedly opening the same table or index does not parse
+    its metadata again unless the file has changed. The returned tree
+    must not be modified. The cache is cleared by _write_xml, as the
+    timestamps of a file rewritten by this process may not have changed.
+    """
+    path = os.path.abspath(filename)
+    st = os.stat(path)
+    return _parse_xml_file(path, st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _write_xml(root, filename):
+    """
+    Writes the specified ElementTree.Element to the specified file as
+    indented XML. The XML is written to a temporary file, synced and then
+    renamed, so that readers never see a partially written file. The
+    temporary file is removed if any of these steps fail.
+    """
+    tree = ElementTree.ElementTree(root)
+    ElementTree.indent(tree, space="  ")
+    dirname, basename = os.path.split(filename)
+    tmp = os.path.join(dirname, "_build_{0}_{1}".format(os.getpid(),
+            basename))
+    try:
+        with open(tmp, "wb") as f:
+            tree.write(f, encoding="utf-8", xml_declaration=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    _parse_xml_file.cache_clear()
+
+
 class Column(object):
     """
     Class representing a column in a table.
@@ -90,9 +139,20 @@ class Column(object):
         WT_CHAR: "char",
         WT_FLOAT: "float",
     }
+    ELEMENT_TYPE_NAME_MAP = dict(
+        (v, k) for k, v in ELEMENT_TYPE_STRING_MAP.items())
+
+    __slots__ = ("__ll_object", "__name", "__description")
 
     def __init__(self, ll_object):
         self.__ll_object = ll_object
+        # Names are used as dictionary keys when looking up columns, so
+        # we decode and intern them once here.
+        self.__name = None
+        self.__description = None
+        if ll_object is not None:
+            self.__name = sys.intern(ll_object.name.decode())
+            self.__description = ll_object.description.decode()
 
     def __str__(self):
         s = "NULL Column"
@@ -118,14 +178,14 @@ class Column(object):
         Returns the name of this column. This is the unique identifier for
         a column.
         """
-        return self.__ll_object.name.decode()
+        return self.__name
 
     def get_description(self):
         """
         Returns the description of this column. This is an optional string
         describing the purpose of a column.
         """
-        return self.__ll_object.description.decode()
+        return self.__description
 
     def get_type(self):
         """
@@ -198,9 +258,6 @@ class Column(object):
         Parses the specified XML column description and returns a new
         Column instance.
         """
-        reverse = {}
-        for k, v in theclass.ELEMENT_TYPE_STRING_MAP.items():
-            reverse[v] = k
         if xmlcol.tag != "column":
             raise ValueError("invalid xml")
         name = xmlcol.get("name").encode()
@@ -214,7 +271,8 @@ class Column(object):
             num_elements = WT_VAR_2
         else:
             num_elements = int(s)
-        element_type = reverse[xmlcol.get("element_type")]
+        type_name = xmlcol.get("element_type")
+        element_type = theclass.ELEMENT_TYPE_NAME_MAP[type_name]
         col = _wormtable.Column(name, description, element_type, element_size,
                 num_elements)
         return theclass(col)
@@ -235,6 +293,8 @@ class Database(object):
         """
         self.__homedir = homedir
         self.__db_name = db_name
+        self.__db_path = os.path.join(homedir, db_name + self.DB_SUFFIX)
+        self.__metadata_path = os.path.join(homedir, db_name + ".xml")
         self.__db_cache_size = DEFAULT_CACHE_SIZE
         self.__ll_object = None
         self.__open_mode = None
@@ -304,8 +364,7 @@ class Database(object):
         """
         Returns the path of the permanent file used to store the database.
         """
-        return os.path.join(self.get_homedir(), self.get_db_name() +
-                self.DB_SUFFIX)
+        return self.__db_path
 
     def get_db_build_path(self):
         """
@@ -327,7 +386,7 @@ class Database(object):
         Returns the path of the file used to store metadata for the
         database.
         """
-        return os.path.join(self.get_homedir(), self.get_db_name() + ".xml")
+        return self.__metadata_path
 
     def set_db_cache_size(self, db_cache_size):
         """
@@ -365,18 +424,14 @@ class Database(object):
         s = "Do not edit this file!"
         comment = ElementTree.Comment(s)
         root.insert(0, comment)
-        raw_xml = ElementTree.tostring(root, 'utf-8')
-        reparsed = minidom.parseString(raw_xml)
-        pretty = reparsed.toprettyxml(indent="  ")
-        with open(filename, "w") as f:
-            f.write(pretty)
+        _write_xml(root, filename)
 
     def read_metadata(self):
         """
         Reads metadata for this database from the metadata file
         and calls set_metadata with the result.
         """
-        tree = ElementTree.parse(self.get_metadata_path())
+        tree = _parse_xml(self.get_metadata_path())
         self.set_metadata(tree)
 
     def finalise_build(self):
@@ -385,7 +440,7 @@ class Database(object):
         """
         new = self.get_db_path()
         old = self.get_db_build_path()
-        shutil.move(old, new)
+        os.replace(old, new)
         self.write_metadata(self.get_metadata_path())
 
     def is_open(self):
@@ -476,6 +531,8 @@ class Table(Database):
 
     def __init__(self, homedir):
         Database.__init__(self, homedir, self.DB_NAME)
+        self.__data_path = os.path.join(homedir, self.DB_NAME +
+                self.DATA_SUFFIX)
         self.__columns = []
         self.__column_name_map = {}
         self.__num_rows = 0
@@ -487,8 +544,7 @@ class Table(Database):
         """
         Returns the path of the permanent data file.
         """
-        return os.path.join(self.get_homedir(), self.get_db_name() +
-                self.DATA_SUFFIX)
+        return self.__data_path
 
     def get_data_build_path(self):
         """
@@ -505,6 +561,23 @@ class Table(Database):
         statinfo = os.stat(self.get_data_path())
         return statinfo.st_size
 
+    def prefetch(self):
+        """
+        Advises the operating system that the db and data files for this
+        table will be read soon, so that it can start reading them into
+        the page cache in the background. This is useful before scanning
+        a large table that is not already cached. It has no effect on
+        platforms that do not support posix_fadvise.
+        """
+        self.verify_open(WT_READ)
+        if hasattr(os, "posix_fadvise"):
+            for path in [self.get_db_path(), self.get_data_path()]:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+
     def finalise_build(self):
         """
         Finalise the build by moving the data and db files to their
@@ -513,7 +586,7 @@ class Table(Database):
         super(Table, self).finalise_build()
         new = self.get_data_path()
         old = self.get_data_build_path()
-        shutil.move(old, new)
+        os.replace(old, new)
 
     def delete(self):
         """
@@ -546,11 +619,11 @@ class Table(Database):
         or permanent locations for the db and data files.
         """
         if build:
-            db_file = self.get_db_build_path().encode()
-            data_file = self.get_data_build_path().encode()
+            db_file = os.fsencode(self.get_db_build_path())
+            data_file = os.fsencode(self.get_data_build_path())
         else:
-            db_file = self.get_db_path().encode()
-            data_file = self.get_data_path().encode()
+            db_file = os.fsencode(self.get_db_path())
+            data_file = os.fsencode(self.get_data_path())
         ll_cols = [c.get_ll_object() for c in self.__columns]
         t = _wormtable.Table(db_file, data_file, ll_cols,
                 self.get_db_cache_size())
@@ -622,8 +695,10 @@ class Table(Database):
         db = description
         if isinstance(description, str):
             db = description.encode()
-        col = _wormtable.Column(nb, db, element_type, size, num_elements)
-        self.__columns.append(Column(col))
+        col = Column(_wormtable.Column(nb, db, element_type, size,
+                num_elements))
+        self.__column_name_map[col.get_name()] = len(self.__columns)
+        self.__columns.append(col)
 
     # Methods for accessing the columns
     def columns(self):
@@ -670,7 +745,7 @@ class Table(Database):
         Reads the schema from the specified file and sets up the columns
         in this table accordingly.
         """
-        tree = ElementTree.parse(filename)
+        tree = _parse_xml(filename)
         root = tree.getroot()
         if root.tag != "schema":
             raise ValueError("root element must be <schema>")
@@ -696,11 +771,7 @@ class Table(Database):
         comment = ElementTree.Comment(s)
         root.insert(0, comment)
         root.set("version", TABLE_METADATA_VERSION)
-        raw_xml = ElementTree.tostring(root, 'utf-8')
-        reparsed = minidom.parseString(raw_xml)
-        pretty = reparsed.toprettyxml(indent="  ")
-        with open(filename, "w") as f:
-            f.write(pretty)
+        _write_xml(root, filename)
 
     def _generate_schema_xml(self):
         """
@@ -802,26 +873,14 @@ class Table(Database):
         """
         Appends the specified row to this table.
         """
-        t = self.get_ll_object()
-        j = 0
-        for v in row:
-            if v is not None:
-                t.insert_elements(j, v)
-            j += 1
-        t.commit_row()
+        self.get_ll_object().append_row(row)
         self.__num_rows += 1
 
     def append_encoded(self, row):
         """
         Appends the specified row to this table.
         """
-        t = self.get_ll_object()
-        j = 0
-        for v in row:
-            if v is not None:
-                t.insert_encoded_elements(j, v)
-            j += 1
-        t.commit_row()
+        self.get_ll_object().append_encoded_row(row)
         self.__num_rows += 1
 
 
@@ -845,7 +904,11 @@ class Table(Database):
         ret = None
         n = len(self)
         if isinstance(key, slice):
-            ret = [self[j] for j in range(*key.indices(n))]
+            start, stop, step = key.indices(n)
+            if step == 1:
+                ret = t.get_rows(start, stop)
+            else:
+                ret = [t.get_row(j) for j in range(start, stop, step)]
         elif isinstance(key, int):
             k = key
             if k < 0:
@@ -973,13 +1036,13 @@ class Index(Database):
         """
         Returns the column specification for this index.
         """
-        s = ""
+        l = []
         for c, w in zip(self.__key_columns, self.__bin_widths):
-            s += c.get_name()
+            s = c.get_name()
             if w != 0.0:
                 s += "[{0}]".format(w)
-            s += "+"
-        return s[:-1]
+            l.append(s)
+        return "+".join(l)
 
     # Methods for accessing the key_columns
     def key_columns(self):
@@ -1006,9 +1069,10 @@ class Index(Database):
         Returns a new instance of _wormtable.Index using ether the build or
         permanent locations for the db.
         """
-        filename = self.get_db_path().encode()
         if build:
-            filename = self.get_db_build_path().encode()
+            filename = os.fsencode(self.get_db_build_path())
+        else:
+            filename = os.fsencode(self.get_db_path())
         cols = [c.get_position() for c in self.__key_columns]
         i = _wormtable.Index(self.__table.get_ll_object(), filename,
                 cols, self.get_db_cache_size())
@@ -1022,19 +1086,15 @@ class Index(Database):
         """
         d = {"version":INDEX_METADATA_VERSION}
         root = ElementTree.Element("index", d)
-        key_columns = ElementTree.Element("key_columns")
-        root.append(key_columns)
-        for j in range(len(self.__key_columns)):
-            c = self.__key_columns[j]
-            w = self.__bin_widths[j]
-            if c.get_type() == WT_INT | c.get_type() == WT_UINT:
+        key_columns = ElementTree.SubElement(root, "key_columns")
+        for c, w in zip(self.__key_columns, self.__bin_widths):
+            if c.get_type() in (WT_INT, WT_UINT):
                 w = int(w)
             d = {
                 "name":c.get_name(),
                 "bin_width":str(w),
             }
-            element = ElementTree.Element("key_column", d)
-            key_columns.append(element)
+            ElementTree.SubElement(key_columns, "key_column", d)
         return ElementTree.ElementTree(root)
 
     def set_metadata(self, tree):
@@ -1102,8 +1162,10 @@ class Index(Database):
         """
         self.verify_open(WT_READ)
         dvi = _wormtable.IndexKeyIterator(self.get_ll_object())
-        for k in dvi:
-            yield self.ll_to_key(k)
+        if len(self.__key_columns) == 1:
+            yield from map(operator.itemgetter(0), dvi)
+        else:
+            yield from dvi
 
 
     def min_key(self, *k):
@@ -1185,17 +1247,11 @@ class Index(Database):
         Translates the specified tuple as a key to a tuple ready to
         for use in the low-level API.
         """
-        cols = self.__key_columns
-        if len(cols) == 1:
-            l = [v]
+        if len(self.__key_columns) == 1:
+            ret = (v,)
         else:
-            n = len(v)
-            l = [None for j in range(n)]
-            for j in range(n):
-                l[j] = v[j]
-                if isinstance(l[j], str):
-                    l[j] = l[j].encode()
-        return tuple(l)
+            ret = tuple(u.encode() if isinstance(u, str) else u for u in v)
+        return ret
 
     def ll_to_key(self, v):
         """
@@ -1223,9 +1279,7 @@ class IndexCounter(collections.abc.Mapping):
         return self.__index.get_ll_object().get_num_rows(k)
 
     def __iter__(self):
-        dvi = _wormtable.IndexKeyIterator(self.__index.get_ll_object())
-        for v in dvi:
-            yield self.__index.ll_to_key(v)
+        return self.__index.keys()
 
     def __len__(self):
         n = 0
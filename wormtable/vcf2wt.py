@@ -89,6 +89,16 @@ FLAG = b"Flag"
 CHARACTER = b"Character"
 STRING = b"String"
 
+# Maps VCF types to the element type and element size of the corresponding
+# column, along with the number of elements if the type fixes it.
+VCF_TYPE_MAP = {
+    INTEGER: (wt.WT_INT, 4, None),
+    FLOAT: (wt.WT_FLOAT, 4, None),
+    FLAG: (wt.WT_UINT, 1, 1),
+    CHARACTER: (wt.WT_CHAR, 1, None),
+    STRING: (wt.WT_CHAR, 1, wt.WT_VAR_1),
+}
+
 class VCFReader(cli.FileReader):
     """
     A class for reading VCF files.
@@ -126,20 +136,24 @@ class VCFReader(cli.FileReader):
         self.__genotypes = [
             sample.strip() for sample in s.split(b"\t")[9:]]
 
-    def add_column(self, table, prefix, line):
+    def parse_column(self, line):
         """
-        Adds a VCF column using the specified metadata line with the specified
-        name prefix to the specified table.
+        Parses the specified metadata line and returns the tuple
+        (name, description, element_type, element_size, num_elements)
+        describing the corresponding column.
         """
+        # The first three key=value pairs are separated by commas; the
+        # last one is the description, which may itself contain commas.
         d = {}
-        s = line[line.find(b"<") + 1: line.find(b">")]
+        pos = line.index(b"<") + 1
+        stop = line.rindex(b">")
         for j in range(3):
-            k = s.find(b",")
-            tokens = s[:k].split(b"=")
-            s = s[k + 1:]
-            d[tokens[0]] = tokens[1]
-        tokens = s.split(b"=", 1)
-        d[tokens[0]] = tokens[1]
+            k = line.find(b",", pos, stop)
+            eq = line.find(b"=", pos, k)
+            d[line[pos:eq]] = line[eq + 1:k]
+            pos = k + 1
+        eq = line.find(b"=", pos, stop)
+        d[line[pos:eq]] = line[eq + 1:stop]
         name = d[ID]
         description = d[DESCRIPTION].strip(b"\"")
         number = d[NUMBER]
@@ -154,26 +168,20 @@ class VCFReader(cli.FileReader):
         if num_elements < 0:
             num_elements = wt.WT_VAR_1
         st = d[TYPE]
-        if st == INTEGER:
-            element_type = wt.WT_INT
-            element_size = 4
-        elif st == FLOAT:
-            element_type = wt.WT_FLOAT
-            element_size = 4
-        elif st == FLAG:
-            element_type = wt.WT_UINT
-            element_size = 1
-            num_elements = 1
-        elif st == CHARACTER:
-            element_type = wt.WT_CHAR
-            element_size = 1
-        elif st == STRING:
-            num_elements = wt.WT_VAR_1
-            element_type = wt.WT_CHAR
-            element_size = 1
-        else:
+        if st not in VCF_TYPE_MAP:
             raise ValueError("Unknown VCF type:", st)
+        element_type, element_size, n = VCF_TYPE_MAP[st]
+        if n is not None:
+            num_elements = n
+        return name, description, element_type, element_size, num_elements
 
+    def add_column(self, table, prefix, column):
+        """
+        Adds a VCF column described by the specified tuple, as returned
+        by parse_column, with the specified name prefix to the specified
+        table.
+        """
+        name, description, element_type, element_size, num_elements = column
         table.add_column(prefix + COLUMN_SEPARATOR + name,  description,
                 element_type, element_size, num_elements)
 
@@ -205,10 +213,12 @@ class VCFReader(cli.FileReader):
         table.add_char_column(FILTER_NAME, FILTER_DESCRIPTION)
 
         for s in info_descriptions:
-            self.add_column(table, INFO_NAME, s)
+            self.add_column(table, INFO_NAME, self.parse_column(s))
+        # Each FORMAT line is repeated for every sample, so parse it once.
+        genotype_columns = [self.parse_column(s) for s in genotype_descriptions]
         for genotype in self.__genotypes:
-            for s in genotype_descriptions:
-                self.add_column(table, genotype, s)
+            for column in genotype_columns:
+                self.add_column(table, genotype, column)
 
     def read_header(self):
         """
@@ -239,6 +249,9 @@ class VCFReader(cli.FileReader):
                 fixed_columns.append((j, table_columns[name]))
         info_columns = {}
         genotype_columns = [{} for g in self.__genotypes]
+        genotype_index = {}
+        for j, g in enumerate(self.__genotypes):
+            genotype_index.setdefault(g, j)
         for k, v in table_columns.items():
             if COLUMN_SEPARATOR in k and v != 0:
                 split = k.split(COLUMN_SEPARATOR)
@@ -248,21 +261,30 @@ class VCFReader(cli.FileReader):
                 else:
                     g = COLUMN_SEPARATOR.join(split[:-1])
                     name = split[-1]
-                    index = self.__genotypes.index(g)
+                    index = genotype_index[g]
                     genotype_columns[index][name] = v
         ref_index = 3
         alt_index = 4
+        # A VCF file typically uses only a few distinct FORMAT strings, so
+        # we cache the fields that map to table columns for each of them.
+        format_plans = {}
+        info_get = info_columns.get
+        # If no genotype columns are in the table we do not need to split
+        # the sample fields; they are left together in the last token.
+        parse_genotypes = any(genotype_columns)
+        max_split = -1 if parse_genotypes else 8
+        truncate = self.__truncate
         # Now we are ready to process the file.
         update_rows = self.get_progress_update_rows()
         num_rows = 0
         for s in self.get_input_file():
-            row = [None for j in range(num_columns)]
-            l = s.split()
+            row = [None] * num_columns
+            l = s.split(None, max_split)
             # Read in the fixed columns
             for vcf_index, wt_index in fixed_columns:
                 if l[vcf_index] != MISSING_VALUE:
                     row[wt_index] = l[vcf_index]
-                    if vcf_index in (ref_index, alt_index) and self.__truncate:
+                    if vcf_index in (ref_index, alt_index) and truncate:
                         # truncate the REF/ALT column if necessary; this is a
                         # temporary workaround until more sophisticated
                         # truncation on a per column basis is implemented.
@@ -270,32 +292,38 @@ class VCFReader(cli.FileReader):
                             row[wt_index] = l[vcf_index][:253] + b'+'
             # Now process the info columns.
             for mapping in l[7].split(b";"):
-                tokens = mapping.split(b"=")
-                name = tokens[0]
-                if name in info_columns:
-                    col = info_columns[name]
-                    if len(tokens) == 2:
-                        row[col] = tokens[1]
+                name, sep, value = mapping.partition(b"=")
+                col = info_get(name)
+                if col is not None:
+                    if sep:
+                        row[col] = value
                     else:
                         # This is a Flag column.
                         row[col] = b"1"
             # Process the genotype columns, if they exist
-            if len(l) > 8:
+            if parse_genotypes and len(l) > 8:
+                plan = format_plans.get(l[8])
+                if plan is None:
+                    fmt = l[8].split(b":")
+                    sample_plans = [
+                        [(k, gc[name]) for k, name in enumerate(fmt)
+                            if name in gc]
+                        for gc in genotype_columns]
+                    plan = len(fmt), sample_plans
+                    format_plans[l[8]] = plan
+                num_fields, sample_plans = plan
                 j = 0
-                fmt = l[8].split(b":")
                 for genotype_values in l[9:]:
                     tokens = genotype_values.split(b":")
-                    if len(tokens) == len(fmt):
-                        for k in range(len(fmt)):
-                            if fmt[k] in genotype_columns[j]:
-                                col = genotype_columns[j][fmt[k]]
-                                tok = tokens[k]
-                                # FIXME this is a hack to detect missing values
-                                # in genotype columns. I'm not sure why anybody
-                                # would do this, but we need it to parse the
-                                # example VCF from the 1000genomes site.
-                                if tok != MISSING_VALUE and tok != b".,.":
-                                    row[col] = tok
+                    if len(tokens) == num_fields:
+                        for k, col in sample_plans[j]:
+                            tok = tokens[k]
+                            # FIXME this is a hack to detect missing values
+                            # in genotype columns. I'm not sure why anybody
+                            # would do this, but we need it to parse the
+                            # example VCF from the 1000genomes site.
+                            if tok != MISSING_VALUE and tok != b".,.":
+                                row[col] = tok
                     j += 1
             yield row
             num_rows += 1
@@ -310,7 +338,6 @@ class VCFWriter(object):
     """
     def __init__(self, table):
         self.__table = table
-        self.__table.read_metadata()
         self.__table.open("w")
 
     def append(self, row):
@@ -369,11 +396,11 @@ class ProgramRunner(object):
         self.__table = wt.Table(self.__destination)
         self.__table.read_schema(self.__schema)
         self.__table.set_db_cache_size(self.__db_cache_size)
-        self.__table.open("w")
+        # Columns are numbered in schema order when the table is opened,
+        # so we don't need to open it here to find their positions.
         self.__column_map = {}
-        for c in self.__table.columns():
-            self.__column_map[c.get_name().encode()] = c.get_position()
-        self.__table.close()
+        for j, c in enumerate(self.__table.columns()):
+            self.__column_map[c.get_name().encode()] = j
 
     def write_table(self):
         """
@@ -383,8 +410,9 @@ class ProgramRunner(object):
         self.__reader.set_progress(self.__progress)
         self.__reader.set_truncate_REF_ALT(self.__truncate)
         self.__writer = VCFWriter(self.__table)
+        append = self.__writer.append
         for r in self.__reader.rows(self.__column_map):
-            self.__writer.append(r)
+            append(r)
         self.__reader.close()
         self.__reader = None
         self.__writer.close()
@@ -87,28 +87,22 @@ class ShowRunner(ProgramRunner):
         """
         Print out the details of the columns in the table.
         """
-        t = self._table
+        columns = self._table.columns()
         # get the max width for name
-        max_name_width = 0
-        for c in t.columns():
-            n = len(c.get_name())
-            if n > max_name_width:
-                max_name_width = n
+        max_name_width = max((len(c.get_name()) for c in columns), default=0)
         fmt = "{0:>4}   {1:{name_width}} {2:<6} {3:>6}   {4:<6}   |   {5}"
         s = fmt.format("", "name", "type", "size", "n", "description",
                     name_width=max_name_width + 2)
-        print("=" * (len(s) + 2))
-        print(s)
-        print("=" * (len(s) + 2))
-        for c in t.columns():
+        rule = "=" * (len(s) + 2)
+        lines = [rule, s, rule]
+        for c in columns:
             num_elements = c.get_num_elements()
-            name = c.get_name()
-            desc = c.get_description()
-            s = fmt.format(c.get_position(), name, c.get_type_name(),
+            s = fmt.format(c.get_position(), c.get_name(), c.get_type_name(),
                     c.get_element_size(),
-                    num_elements if num_elements > 0 else "var(1)", desc,
-                    name_width=max_name_width + 2)
-            print(s)
+                    num_elements if num_elements > 0 else "var(1)",
+                    c.get_description(), name_width=max_name_width + 2)
+            lines.append(s)
+        print("\n".join(lines))
 
 class ListRunner(ProgramRunner):
     """